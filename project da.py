@@ -2,6 +2,8 @@
 # 1. PROJECT SETUP AND DATA LOADING
 # This script performs a full Exploratory Data Analysis (EDA) workflow.
 # ==============================================================================
+import os
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -12,28 +14,127 @@ sns.set_style('whitegrid')
 plt.rcParams['figure.figsize'] = (10, 6)
 plt.rcParams['font.family'] = 'Inter'
 
-# Simulate loading the dataset (using dummy data for guaranteed runnability)
-# In a real scenario, replace 'tmdb_movies.csv' with your actual file path.
+# Fixed inputs hoisted to module level so each step reuses the same objects
+# instead of rebuilding the lists (and re-inferring formats) per use.
+NUMERIC_COLS = ['budget', 'revenue', 'runtime', 'vote_average']
+OUTLIER_COLS = ['budget', 'revenue', 'runtime']
+RELEASE_DATE_FORMAT = '%Y-%m-%d'
+
+# Prefer Arrow's multi-threaded CSV reader: it parses directly into columnar
+# buffers, so load time scales with core count instead of a single thread.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# Numba JIT-compiles per-row helpers to parallel machine code; fall back to
+# plain NumPy if it is not installed so the script stays runnable anywhere.
 try:
-    # Attempt to load a real file (will likely fail in this environment)
-    df = pd.read_csv('tmdb_movies.csv')
-except FileNotFoundError:
-    print("Dataset not found. Using a dummy DataFrame for demonstration.")
-    # Create a dummy DataFrame if the file isn't available
-    data = {
-        'title': ['Avatar', 'Titanic', 'Avengers', 'Joker', 'Inception'],
-        'release_date': ['2009-12-18', '1997-12-19', '2012-05-04', '2019-10-04', '2010-07-16'],
-        'budget': [237000000, 200000000, 220000000, 55000000, 160000000],
-        'revenue': [2787965087, 2257844554, 1518815515, 1074219000, 825532764],
-        'runtime': [162, 194, 143, 122, 148],
-        'vote_average': [7.2, 7.5, 7.8, 8.4, 8.8],
-        'genre': ['Action', 'Drama', 'Action', 'Drama', 'Sci-Fi'],
-        'director': ['James Cameron', 'James Cameron', 'Joss Whedon', 'Todd Phillips', 'Christopher Nolan'],
-        'is_english': [True, True, True, True, True]
-    }
-    df = pd.DataFrame(data)
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True)
+    def compute_roi(budget, revenue, out):
+        # Per-row loop lowers to LLVM with prange multi-core scaling.
+        for i in prange(budget.size):
+            out[i] = (revenue[i] - budget[i]) / max(budget[i], 1)
+else:
+    def compute_roi(budget, revenue, out):
+        np.divide(revenue - budget, np.maximum(budget, 1), out=out)
+
+# Raw dataset and the cleaned frame persisted from a previous run.
+RAW_CSV = 'tmdb_movies.csv'
+CLEAN_PARQUET = 'tmdb_clean.parquet'
+
+# The cache only counts if it is at least as new as the CSV, so an updated
+# dataset is re-cleaned instead of being shadowed by a stale Parquet file.
+cache_fresh = os.path.exists(CLEAN_PARQUET) and (
+    not os.path.exists(RAW_CSV)
+    or os.path.getmtime(CLEAN_PARQUET) >= os.path.getmtime(RAW_CSV)
+)
+
+using_dummy = False
+if cache_fresh:
+    # Repeat runs skip CSV parsing and re-cleaning entirely: Parquet keeps
+    # the already-downcast frame in compressed column chunks, and each EDA
+    # step only decompresses the columns it actually touches.
+    df = pd.read_parquet(CLEAN_PARQUET)
+else:
+    # Simulate loading the dataset (using dummy data for guaranteed runnability)
+    # In a real scenario, replace 'tmdb_movies.csv' with your actual file path.
+    try:
+        # Attempt to load a real file (will likely fail in this environment)
+        if pa is not None:
+            # Declare column types up front so Arrow parses numbers and dates in
+            # one pass (no later pd.to_datetime sweep needed).
+            convert_options = pacsv.ConvertOptions(column_types={
+                'release_date': pa.timestamp('s'),
+                'budget': pa.int64(),
+                'revenue': pa.int64(),
+                # Real exports format runtime as floats ("81.0") and may have
+                # nulls, so parse as float32 here and downcast after cleaning.
+                'runtime': pa.float32(),
+                'vote_average': pa.float32(),
+            })
+            df = pacsv.read_csv(RAW_CSV, convert_options=convert_options).to_pandas()
+        else:
+            # Fall back to pandas' single-threaded C engine if pyarrow is absent.
+            df = pd.read_csv(RAW_CSV)
+    except FileNotFoundError:
+        print("Dataset not found. Using a dummy DataFrame for demonstration.")
+        # Create a dummy DataFrame if the file isn't available
+        data = {
+            'title': ['Avatar', 'Titanic', 'Avengers', 'Joker', 'Inception'],
+            'release_date': ['2009-12-18', '1997-12-19', '2012-05-04', '2019-10-04', '2010-07-16'],
+            'budget': [237000000, 200000000, 220000000, 55000000, 160000000],
+            'revenue': [2787965087, 2257844554, 1518815515, 1074219000, 825532764],
+            'runtime': [162, 194, 143, 122, 148],
+            'vote_average': [7.2, 7.5, 7.8, 8.4, 8.8],
+            'genre': ['Action', 'Drama', 'Action', 'Drama', 'Sci-Fi'],
+            'director': ['James Cameron', 'James Cameron', 'Joss Whedon', 'Todd Phillips', 'Christopher Nolan'],
+            'is_english': [True, True, True, True, True]
+        }
+        df = pd.DataFrame(data)
+        using_dummy = True
+
+    # Parse dates with the explicit format: a no-op for the Arrow path (already
+    # timestamps) and a single fast strptime pass for the string fallbacks,
+    # skipping pandas' per-value format inference.
+    df['release_date'] = pd.to_datetime(df['release_date'], format=RELEASE_DATE_FORMAT, cache=True)
+
+    # Shrink the in-memory footprint: the EDA steps below (.describe, .corr,
+    # plotting) are memory-bound scans, so narrower columns mean faster passes.
+    for col in ['budget', 'revenue']:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    # Nullable Int16: real CSVs deliver runtime as float64 with NaN for the
+    # missing entries, which a plain int16 cast would refuse to convert.
+    df['runtime'] = df['runtime'].astype('Int16')
+    df['vote_average'] = df['vote_average'].astype('float32')
+    # Repeated strings become categoricals (stored once, referenced by code).
+    for col in ['title', 'genre', 'director']:
+        df[col] = df[col].astype('category')
+
+    # Precompute the log-transformed budget once: a single vectorized log1p pass
+    # over the raw ndarray, reused by every later plot instead of re-scanning.
+    df['log_budget'] = np.log1p(df['budget'].to_numpy(dtype=np.float32))
+
+    # Per-row return on investment via the compiled helper. Numba works on raw
+    # ndarrays (.to_numpy), not Series, so extract the buffers first.
+    roi = np.empty(len(df), dtype=np.float64)
+    compute_roi(df['budget'].to_numpy(np.int64), df['revenue'].to_numpy(np.int64), roi)
+    df['roi'] = roi
+
+    # Persist the cleaned frame so subsequent runs read Parquet instead of
+    # re-parsing and re-downcasting the CSV (skip the dummy sample).
+    if pa is not None and not using_dummy:
+        df.to_parquet(CLEAN_PARQUET, engine='pyarrow', compression='zstd')
 
 print("Data Loading Complete.")
+print("\n--- Memory Usage After Downcasting (bytes) ---")
+print(df.memory_usage(deep=True))
 
 # ==============================================================================
 # 2. INITIAL DATA INSPECTION AND STRUCTURE
@@ -63,24 +164,44 @@ print("="*50)
 
 # 3.1 Handling Missing Values
 print("\n--- 3.1 Missing Value Report ---")
-missing_values = df.isnull().sum()
-missing_percentage = (missing_values / len(df)) * 100
+# Materialize the null mask once and derive both the counts and the
+# percentages from the same array, instead of re-reading it per statistic.
+null_mask = df.isna().to_numpy()
+missing_values = null_mask.sum(axis=0)
+missing_percentage = missing_values * (100.0 / len(df))
 
 missing_df = pd.DataFrame({
     'Missing Count': missing_values,
     'Missing Percentage': missing_percentage
-}).sort_values(by='Missing Count', ascending=False)
+}, index=df.columns).sort_values(by='Missing Count', ascending=False)
 
 print(missing_df)
 
 # 3.2 Outlier Detection (Initial Visual Check)
 print("\n--- 3.2 Numerical Feature Descriptive Statistics ---")
-print(df[['budget', 'revenue', 'runtime', 'vote_average']].describe())
+print(df[NUMERIC_COLS].describe())
 
 # Visualizing distributions using Box Plots for outliers
-plt.figure(figsize=(12, 4))
-sns.boxplot(data=df[['budget', 'revenue', 'runtime']], orient='h')
-plt.title('Box Plots for Budget, Revenue, and Runtime')
+# Compute the quartiles for all three columns in one vectorized (NaN-aware)
+# nanquantile pass over a stacked float32 matrix, then hand the precomputed
+# stats straight to matplotlib's bxp instead of letting seaborn re-derive
+# the quantiles column-by-column through pandas. Whiskers follow the usual
+# 1.5*IQR convention so points beyond them still read as outliers.
+outlier_block = df[OUTLIER_COLS].to_numpy(dtype=np.float32, na_value=np.nan).T
+q = np.nanquantile(outlier_block, [0.25, 0.5, 0.75], axis=1)
+iqr = q[2] - q[0]
+low_fence = q[0] - 1.5 * iqr
+high_fence = q[2] + 1.5 * iqr
+box_stats = []
+for i, col in enumerate(OUTLIER_COLS):
+    vals = outlier_block[i]
+    # Most extreme data points still inside the fences (NaN compares False).
+    inside = vals[(vals >= low_fence[i]) & (vals <= high_fence[i])]
+    box_stats.append(dict(med=q[1, i], q1=q[0, i], q3=q[2, i],
+                          whislo=inside.min(), whishi=inside.max(), label=col))
+fig, ax = plt.subplots(figsize=(12, 4))
+ax.bxp(box_stats, vert=False, showfliers=False)
+ax.set_title('Box Plots for Budget, Revenue, and Runtime')
 plt.show()
 
 # ==============================================================================
@@ -105,22 +226,40 @@ plt.title('Vote Average Distribution')
 
 # Budget Distribution (log-transformed due to skew)
 plt.subplot(1, 3, 3)
-sns.histplot(np.log1p(df['budget']), bins=10, kde=True, color='lightgreen')
+sns.histplot(df['log_budget'], bins=10, kde=True, color='lightgreen')
 plt.title('Log-Transformed Budget Distribution')
 
 plt.tight_layout()
 plt.show()
 
 # 4.2 Categorical Distributions (Value Counts)
+# Count each genre once (a bincount over the category codes) and feed the
+# same result to both the report and the plot, instead of letting countplot
+# recompute the aggregation internally.
+genre_counts = df['genre'].value_counts()
 print("\n--- 4.2 Top 5 Movie Genres ---")
-print(df['genre'].value_counts().head())
+print(genre_counts.head())
 
 # Visualizing genre counts
 plt.figure(figsize=(8, 6))
-sns.countplot(y='genre', data=df, order=df['genre'].value_counts().index)
+sns.barplot(x=genre_counts.values, y=genre_counts.index.astype(str))
 plt.title('Movie Count by Primary Genre')
 plt.show()
 
+# 4.3 Director Revenue Rollup
+print("\n--- 4.3 Top 5 Directors by Mean Revenue ---")
+# Route the aggregation through pandas' numba engine when available: the
+# per-group reduction runs as a cached compiled kernel instead of Cython
+# dispatch, which pays off on large tmdb-scale group-bys.
+if njit is not None:
+    director_revenue = df.groupby('director', observed=True)['revenue'].agg(
+        'mean', engine='numba',
+        engine_kwargs={'parallel': True, 'nogil': True, 'nopython': True},
+    )
+else:
+    director_revenue = df.groupby('director', observed=True)['revenue'].mean()
+print(director_revenue.sort_values(ascending=False).head())
+
 # ==============================================================================
 # 5. BIVARIATE AND MULTIVARIATE ANALYSIS (VISUALIZING RELATIONSHIPS)
 # ==============================================================================
@@ -129,8 +268,18 @@ print("STEP 5: BIVARIATE AND MULTIVARIATE ANALYSIS")
 print("="*50)
 
 # 5.1 Correlation Heatmap
-numerical_df = df[['budget', 'revenue', 'runtime', 'vote_average']].copy()
-correlation_matrix = numerical_df.corr()
+# Stack the numeric columns into one C-contiguous float32 block so the whole
+# matrix comes from a single BLAS-backed corrcoef call, rather than pandas
+# dispatching pairwise per column. Mask NaN first: a plain np.corrcoef would
+# turn every entry involving a gappy column into NaN, whereas the masked
+# variant keeps pandas' pairwise-complete semantics.
+numerical_block = np.ma.masked_invalid(np.ascontiguousarray(
+    df[NUMERIC_COLS].to_numpy(dtype=np.float32, na_value=np.nan).T
+))
+correlation_matrix = pd.DataFrame(
+    np.ma.corrcoef(numerical_block).filled(np.nan),
+    index=NUMERIC_COLS, columns=NUMERIC_COLS
+)
 
 plt.figure(figsize=(8, 6))
 sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', fmt=".2f", linewidths=.5)
@@ -138,8 +287,17 @@ plt.title('Correlation Matrix of Numerical Features')
 plt.show()
 
 # 5.2 Scatter Plot: Budget vs. Revenue
+# A matplotlib scatter creates one styled artist per point and melts beyond
+# ~50k rows. For real tmdb-scale data, rasterize into a fixed 256x256
+# density grid instead, so render cost stops growing with N.
 plt.figure(figsize=(8, 6))
-sns.scatterplot(x='budget', y='revenue', data=df, hue='vote_average', size='vote_average', sizes=(20, 200))
+if len(df) > 50_000:
+    H, xedges, yedges = np.histogram2d(df['budget'], df['revenue'], bins=256)
+    plt.imshow(np.log1p(H).T, origin='lower', aspect='auto', cmap='viridis',
+               extent=[xedges[0], xedges[-1], yedges[0], yedges[-1]])
+    plt.colorbar(label='log(1 + movies per bin)')
+else:
+    sns.scatterplot(x='budget', y='revenue', data=df, hue='vote_average', size='vote_average', sizes=(20, 200))
 plt.title('Budget vs. Revenue (Colored by Vote Average)')
 plt.xlabel('Budget (in hundred millions)')
 plt.ylabel('Revenue (in billions)')